@@ -7,7 +7,6 @@ import sys
 import os
 import re
 import argparse
-from pypdf import PdfReader, PdfWriter, PageRange  # No change needed here
 
 # --- Console colors (ANSI). Optionally enable on Windows with colorama ---
 RESET  = "\033[0m"
@@ -28,6 +27,15 @@ try:
 except Exception:
     pass
 
+# Config line: filename, optional bookmark title in (), and optional pages_spec
+MERGE_LINE_PATTERN = re.compile(
+    r'(.+\.pdf)\s*(?:\(\s*(.*?)\s*\))?\s*(?::\s*(.*?)\s*)?$',
+    re.IGNORECASE
+)
+
+# pypdf writes many small chunks per object; buffer them into few syscalls
+WRITE_BUFFER_SIZE = 1 << 20
+
 # --- Global logs for end-of-run summary ---
 ERROR_LOG: list[str] = []
 WARN_LOG:  list[str] = []
@@ -42,20 +50,14 @@ def read_merge_config_from_file(config_file_path):
     original_lines = []  # Store original lines to iterate through later for printing
     try:
         with open(config_file_path, 'r') as f:
-            lines = f.readlines()
-            for line_num, line in enumerate(lines, 1):
+            for line_num, line in enumerate(f, 1):
                 original_line_text = line.strip()
                 original_lines.append(original_line_text)  # Store the raw line
 
                 if not original_line_text or original_line_text.startswith('#'):  # Skip processing for comments/blanks
                     continue
 
-                # Regex to capture filename, optional bookmark title in (), and optional pages_spec
-                match = re.match(
-                    r'(.+\.pdf)\s*(?:\(\s*(.*?)\s*\))?\s*(?::\s*(.*?)\s*)?$',
-                    original_line_text,
-                    re.IGNORECASE
-                )
+                match = MERGE_LINE_PATTERN.match(original_line_text)
 
                 if match:
                     filename = match.group(1).strip()
@@ -90,6 +92,11 @@ def read_merge_config_from_file(config_file_path):
 
     return config, original_lines
 
+def parse_page_number(s):
+    """Returns the integer value of a plain digit string, or None if it is not one."""
+    s = s.strip()
+    return int(s) if s.isdecimal() else None
+
 # --- parse_merge_page_string remains the same (adds red errors via caller) ---
 def parse_merge_page_string(page_str, total_pages):
     """
@@ -132,24 +139,24 @@ def parse_merge_page_string(page_str, total_pages):
         if '-' in part:
             # Handle range
             start_str, end_str = part.split('-', 1)
-            try:
-                start = int(start_str.strip()) - 1
-                end = int(end_str.strip()) - 1
-                if start < 0 or end >= total_pages or start > end:
-                    raise ValueError(f"Invalid page range '{part}'. Max page is {total_pages}.")
-                indices.update(range(start, end + 1))
-            except ValueError:
+            start_num = parse_page_number(start_str)
+            end_num = parse_page_number(end_str)
+            if start_num is None or end_num is None:
                 raise ValueError(f"Invalid page range format: '{part}'")
+            start = start_num - 1
+            end = end_num - 1
+            if start < 0 or end >= total_pages or start > end:
+                raise ValueError(f"Invalid page range '{part}'. Max page is {total_pages}.")
+            indices.update(range(start, end + 1))
         else:
             # Handle single page
-            try:
-                page_num = int(part.strip())
-                index = page_num - 1
-                if index < 0 or index >= total_pages:
-                    raise ValueError(f"Invalid page number '{page_num}'. Max page is {total_pages}.")
-                indices.add(index)
-            except ValueError:
+            page_num = parse_page_number(part)
+            if page_num is None:
                 raise ValueError(f"Invalid page number format: '{part}'")
+            index = page_num - 1
+            if index < 0 or index >= total_pages:
+                raise ValueError(f"Invalid page number '{page_num}'. Max page is {total_pages}.")
+            indices.add(index)
 
     sorted_indices = sorted(list(indices))
     if not sorted_indices:
@@ -164,6 +171,9 @@ def merge_pdfs_from_config(config, original_lines, output_pdf_path):
     Adds bookmarks (TOC) for each input file using specified or default titles.
     Prints status line by line based on original_lines.
     """
+    # Imported here so --help and config errors do not pay for loading pypdf
+    from pypdf import PdfReader, PdfWriter
+
     merger = PdfWriter()
     total_pages_merged = 0
     # Map from original line index to config entry for easy lookup
@@ -190,7 +200,7 @@ def merge_pdfs_from_config(config, original_lines, output_pdf_path):
         error_message = None
 
         try:
-            reader = PdfReader(input_filename)
+            reader = PdfReader(input_filename, strict=False)
             num_input_pages = len(reader.pages)
             if num_input_pages == 0:
                 raise ValueError("Input PDF is empty.")
@@ -200,19 +210,20 @@ def merge_pdfs_from_config(config, original_lines, output_pdf_path):
             if not page_indices:
                 raise ValueError("No pages selected or specified.")
 
-            # --- Add Bookmark/TOC Entry ---
-            bookmark_target_page_index = len(merger.pages)
             bookmark_title = (
                 custom_bookmark_title
                 if custom_bookmark_title
                 else os.path.splitext(os.path.basename(input_filename))[0]
             )
-            merger.add_outline_item(bookmark_title, bookmark_target_page_index)
-            # --- End Bookmark ---
 
-            # Add the selected pages
-            for index in page_indices:
-                merger.add_page(reader.pages[index])
+            # Add the selected pages in one batch; outline_item adds the
+            # bookmark/TOC entry pointing at the first appended page
+            merger.append(
+                fileobj=reader,
+                pages=page_indices,
+                import_outline=False,
+                outline_item=bookmark_title,
+            )
 
             num_added = len(page_indices)
             total_pages_merged += num_added
@@ -236,7 +247,7 @@ def merge_pdfs_from_config(config, original_lines, output_pdf_path):
     # Write the final merged PDF
     if total_pages_merged > 0:
         try:
-            with open(output_pdf_path, "wb") as f_out:
+            with open(output_pdf_path, "wb", buffering=WRITE_BUFFER_SIZE) as f_out:
                 merger.write(f_out)
             print(f'\n"{output_pdf_path}" with {total_pages_merged} pages created!')
         except Exception as e:
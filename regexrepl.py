@@ -6,6 +6,7 @@ exec "$(dirname "$0")/.venv/bin/python" "$0" "$@"
 import re
 import sys
 import os
+import shutil
 
 def print_usage():
     print("Usage: ./regexrepl.py <filename> <regex_pattern> <replacement_string>")
@@ -72,12 +73,12 @@ def main():
     # 3. Create Backup
     backup_path = file_path + ".bak"
     try:
+        # Kernel-side copy for the backup; the read below hits a warm page cache
+        shutil.copyfile(file_path, backup_path)
+        print(f"Backup created: {backup_path}")
+
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
-        
-        with open(backup_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        print(f"Backup created: {backup_path}")
 
         # 4. Perform Replacement with Interactive Callback
         replacer = Replacer(replace_string)
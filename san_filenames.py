@@ -6,17 +6,19 @@ exec "$(dirname "$0")/.venv/bin/python" "$0" "$@"
 
 
 
-import argparse
 import os
-import re
-from typing import Set, Tuple, List
+import sys
+from typing import Dict, Set, Tuple, List
 
-ILLEGAL_RE = re.compile(r'[<>:"/\\|?*]')
+ILLEGAL_CHARS = '<>:"/\\|?*'
+ILLEGAL_TRANS = str.maketrans({c: '-' for c in ILLEGAL_CHARS})
+ILLEGAL_SET = frozenset(ILLEGAL_CHARS)
 RESERVED = {
     "CON","PRN","AUX","NUL",
     *(f"COM{i}" for i in range(1,10)),
     *(f"LPT{i}" for i in range(1,10)),
 }
+RESERVED_LOWER = frozenset(r.lower() for r in RESERVED)
 
 def print_usage_script(prog: str) -> None:
     msg = f"""\
@@ -49,55 +51,105 @@ Rules applied:
 """
     print(msg)
 
-def sanitize_component(name: str) -> str:
-    """Apply Windows filename rules to a single path component."""
-    new = ILLEGAL_RE.sub('-', name)      # replace illegal characters
+def split_ext(name: str) -> Tuple[str, str]:
+    """Same split as os.path.splitext for a bare name (leading dots are not an extension)."""
+    base, dot, ext = name.rpartition('.')
+    if not base.strip('.'):
+        return name, ""
+    return base, dot + ext
+
+def sanitize_component(name: str) -> Tuple[str, str, str]:
+    """Apply Windows filename rules to a single path component.
+
+    Returns (new_name, base, ext) so callers need not split the name again.
+    """
+    # Fast path: most names are already clean, skip translate/rstrip
+    if name and not name.endswith((' ', '.')) and ILLEGAL_SET.isdisjoint(name):
+        base, ext = split_ext(name)
+        if (base if base.islower() else base.lower()) not in RESERVED_LOWER:
+            return name, base, ext
+    new = name.translate(ILLEGAL_TRANS)  # replace illegal characters
     new = new.rstrip(' .')               # trim trailing spaces/dots
     if not new:
         new = "_"                        # avoid empty names
-    base, ext = os.path.splitext(new)
-    if base.upper() in RESERVED:         # avoid reserved basenames
-        new = f"{base}-reserved{ext}"
-    return new
-
-def unique_in_dir(candidate: str, src_name: str,
-                  planned: Set[str], existing: Set[str]) -> str:
-    """Ensure 'candidate' is unique within a directory (consider planned+existing)."""
+    base, ext = split_ext(new)
+    if (base if base.islower() else base.lower()) in RESERVED_LOWER:  # avoid reserved basenames
+        base = f"{base}-reserved"
+        new = f"{base}{ext}"
+    return new, base, ext
+
+def unique_in_dir(base: str, ext: str, src_name: str,
+                  planned: Set[str], existing: Set[str],
+                  next_idx: Dict[Tuple[str, str], int]) -> str:
+    """Ensure base+ext is unique within a directory (consider planned+existing).
+
+    next_idx remembers, per (base, ext), where the previous -N probe stopped;
+    taken names only accumulate, so the next probe can resume there.
+    """
+    candidate = f"{base}{ext}"
     if candidate == src_name:
         return candidate
     if candidate not in existing and candidate not in planned:
         return candidate
-    base, ext = os.path.splitext(candidate)
-    i = 2
+    key = (base, ext)
+    i = next_idx.get(key, 2)
     while True:
         alt = f"{base}-{i}{ext}"
-        if alt == src_name:
-            i += 1
-            continue
-        if alt not in existing and alt not in planned:
+        if alt != src_name and alt not in existing and alt not in planned:
+            next_idx[key] = i + 1
             return alt
         i += 1
 
-def plan_changes_for_dir(root: str, names: List[str]) -> List[tuple]:
-    """Return a list of (src_path, dst_path) for items that need renaming in this dir."""
+def plan_changes_for_dir(entries: List[os.DirEntry]) -> List[tuple]:
+    """Return a list of (src_name, dst_name) for items that need renaming in this dir."""
+    pending = []
+    for e in entries:
+        name = e.name
+        new, base, ext = sanitize_component(name)
+        if new != name:
+            pending.append((name, base, ext))
+    if not pending:
+        return []  # all clean: no sets needed
+
     changes = []
-    existing = set(names)
+    existing = {e.name for e in entries}  # also reserves current names of clean entries
     planned: Set[str] = set()
+    next_idx: Dict[Tuple[str, str], int] = {}
 
-    for name in names:
-        new = sanitize_component(name)
-        if new == name:
-            planned.add(name)  # reserve current name to avoid collisions
-            continue
-        unique = unique_in_dir(new, name, planned, existing)
+    for name, base, ext in pending:
+        unique = unique_in_dir(base, ext, name, planned, existing, next_idx)
         planned.add(unique)
-        src = os.path.join(root, name)
-        dst = os.path.join(root, unique)
-        if src != dst:
-            changes.append((src, dst))
+        if unique != name:
+            changes.append((name, unique))
     return changes
 
+def walk_bottom_up(path: str, name: str = None, parent_fd: int = None):
+    """Yield (dir_path, entries, dir_fd) bottom-up (children before parents).
+
+    Each directory is listed once via os.scandir on an open directory fd,
+    and the fd stays open while its entry is yielded so renames can be made
+    relative to it.
+    """
+    try:
+        if parent_fd is None:
+            dfd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+        else:  # never follow symlinks below the root
+            dfd = os.open(name, os.O_RDONLY | os.O_DIRECTORY | os.O_NOFOLLOW, dir_fd=parent_fd)
+    except OSError:
+        return
+    try:
+        with os.scandir(dfd) as it:
+            entries = list(it)
+        for e in entries:
+            if e.is_dir(follow_symlinks=False):
+                yield from walk_bottom_up(os.path.join(path, e.name), e.name, dfd)
+        yield path, entries, dfd
+    finally:
+        os.close(dfd)
+
 def main():
+    import argparse  # CLI only; keeps library imports of this module light
+
     ap = argparse.ArgumentParser(
         description="Sanitize filenames for Windows compatibility (recursive).",
         add_help=True
@@ -119,27 +171,37 @@ def main():
 
     total_changes = 0
     total_errors = 0
+    rename = os.rename  # local alias for the rename loop
+
+    # Walk bottom-up so children are renamed before parent directories.
+    # The walker hands us an fd for each directory, so renames resolve names
+    # relative to it instead of re-walking the full path.
+    for root, entries, dfd in walk_bottom_up(rootdir):
+        changes = plan_changes_for_dir(entries)
 
-    # Walk bottom-up so children are renamed before parent directories
-    for root, dirnames, filenames in os.walk(rootdir, topdown=False):
-        names = dirnames + filenames
-        changes = plan_changes_for_dir(root, names)
+        if not changes:
+            continue
 
+        # Output is collected per directory and written in one call
+        lines = []
         if not args.do:
             # Default: dry-run + show-dest
             for src, dst in changes:
-                print(f"{src} -> {dst}")
+                lines.append(f"{os.path.join(root, src)} -> {os.path.join(root, dst)}")
             total_changes += len(changes)
         else:
             # Perform renames, no preview
             for src, dst in changes:
+                src_path = os.path.join(root, src)
+                dst_path = os.path.join(root, dst)
                 try:
-                    os.rename(src, dst)
-                    print(f"{src} -> {dst}")
+                    rename(src, dst, src_dir_fd=dfd, dst_dir_fd=dfd)
+                    lines.append(f"{src_path} -> {dst_path}")
                     total_changes += 1
-                except Exception as e:
-                    print(f"[ERROR] {src} -> {dst} : {e}")
+                except OSError as e:
+                    lines.append(f"[ERROR] {src_path} -> {dst_path} : {e}")
                     total_errors += 1
+        sys.stdout.write("\n".join(lines) + "\n")
 
     if not args.do:
         print(f"\nSummary (dry-run): {total_changes} items would be renamed.")
@@ -8,15 +8,51 @@ import sys
 import re
 import shutil
 import os
+import tempfile
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
 # List of "small words" that should remain lowercase (unless they are the first/last word)
 # Only used for Title Case
-SMALL_WORDS = {
+SMALL_WORDS = frozenset({
     "a", "an", "the", "and", "but", "or", "nor", "for", "yet", "so",
     "at", "by", "for", "in", "of", "on", "to", "up", "via", "vs", "vs.",
     "with", "from", "into", "onto", "upon", "as", "your"
-}
+})
+
+# Punctuation ignored when deciding whether a word is a small word
+PUNCT_CHARS = ".,:;?!'\"()[]{}"
+PUNCT_SET = frozenset(PUNCT_CHARS)
+
+# Regex to capture: 
+# Group 1: The hashtags (#, ##, etc)
+# Group 2: The text content
+# Group 3: Optional attributes like {#id} or {.class}
+HEADER_PATTERN = re.compile(r'^(#+)\s+(.*?)(?:\s+(\{.*\})\s*)?$')
+
+def title_case_word(word, i, last, small_words):
+    """Title-cases a single word given its position (last = index of last word)."""
+    # 1. Acronym Check
+    if len(word) > 1 and word.isupper():
+        return word
+
+    # 2. First or Last word -> Capitalize
+    if i == 0 or i == last:
+        return word.capitalize()
+
+    # clean_word strips punctuation for checking logic
+    if word[0] in PUNCT_SET or word[-1] in PUNCT_SET:
+        clean_word = word.strip(PUNCT_CHARS).lower()
+    else:
+        clean_word = word if word.islower() else word.lower()
+
+    # 3. Small word -> Lowercase
+    if clean_word in small_words:
+        return word.lower()
+
+    # 4. Regular word -> Capitalize
+    return word.capitalize()
 
 def to_title_case(text):
     """
@@ -27,30 +63,10 @@ def to_title_case(text):
     if not words:
         return text
 
-    new_words = []
-    
-    for i, word in enumerate(words):
-        # clean_word strips punctuation for checking logic
-        clean_word = word.strip(".,:;?!'\"()[]{}").lower()
-        
-        # 1. Acronym Check
-        if word.isupper() and len(word) > 1:
-            new_words.append(word)
-            continue
-            
-        # 2. First or Last word -> Capitalize
-        if i == 0 or i == len(words) - 1:
-            new_words.append(word.capitalize())
-        
-        # 3. Small word -> Lowercase
-        elif clean_word in SMALL_WORDS:
-            new_words.append(word.lower())
-            
-        # 4. Regular word -> Capitalize
-        else:
-            new_words.append(word.capitalize())
-
-    return " ".join(new_words)
+    last = len(words) - 1
+    small_words = SMALL_WORDS  # local alias for the comprehension
+    return " ".join([title_case_word(word, i, last, small_words)
+                     for i, word in enumerate(words)])
 
 def to_lowercase_style(text):
     """
@@ -61,22 +77,12 @@ def to_lowercase_style(text):
     if not words:
         return text
 
-    new_words = []
-    
-    for i, word in enumerate(words):
-        # 1. Acronym Check (Keep if all caps and length > 1)
-        if word.isupper() and len(word) > 1:
-            new_words.append(word)
-            
-        # 2. First word -> Capitalize (if not an acronym)
-        elif i == 0:
-            new_words.append(word.capitalize())
-            
-        # 3. All other words -> Lowercase
-        else:
-            new_words.append(word.lower())
-            
-    return " ".join(new_words)
+    # 1. Acronyms (all caps, length > 1) are kept; 2. the first word is
+    # capitalized; 3. all other words are lowercased.
+    first = words[0]
+    head = first if len(first) > 1 and first.isupper() else first.capitalize()
+    return " ".join([head] + [word if len(word) > 1 and word.isupper() else word.lower()
+                              for word in words[1:]])
 
 def process_qmd_file(file_path, backup=False, style="titlecase"):
     if not os.path.exists(file_path):
@@ -94,48 +100,34 @@ def process_qmd_file(file_path, backup=False, style="titlecase"):
             print(f"Error creating backup: {e}")
             return
 
+    header_match = HEADER_PATTERN.match
+    convert = to_lowercase_style if style == "lowercase" else to_title_case
+
+    # Stream into a temp file next to the original, then atomically replace it
+    tmp = tempfile.NamedTemporaryFile('w', encoding='utf-8', delete=False,
+                                      dir=os.path.dirname(file_path) or '.')
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+        with tmp, open(file_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                match = header_match(line)
+
+                if match:
+                    hashes = match.group(1)
+                    content = match.group(2)
+                    attributes = match.group(3) if match.group(3) else ""
+
+                    # Reconstruct the line
+                    attr_spacer = " " if attributes else ""
+                    tmp.write(f"{hashes} {convert(content)}{attr_spacer}{attributes}\n")
+                else:
+                    tmp.write(line)
+        shutil.copymode(file_path, tmp.name)
+        os.replace(tmp.name, file_path)
     except Exception as e:
-        print(f"Error reading file: {e}")
+        os.unlink(tmp.name)
+        print(f"Error processing file: {e}")
         return
 
-    new_lines = []
-    
-    # Regex to capture: 
-    # Group 1: The hashtags (#, ##, etc)
-    # Group 2: The text content
-    # Group 3: Optional attributes like {#id} or {.class}
-    header_pattern = re.compile(r'^(#+)\s+(.*?)(?:\s+(\{.*\})\s*)?$')
-
-    for line in lines:
-        match = header_pattern.match(line)
-        
-        if match:
-            hashes = match.group(1)
-            content = match.group(2)
-            attributes = match.group(3) if match.group(3) else ""
-            
-            # Select the conversion method based on argument
-            if style == "lowercase":
-                new_content = to_lowercase_style(content)
-            else:
-                new_content = to_title_case(content)
-            
-            # Reconstruct the line
-            attr_spacer = " " if attributes else ""
-            new_line = f"{hashes} {new_content}{attr_spacer}{attributes}\n"
-            new_lines.append(new_line)
-        else:
-            new_lines.append(line)
-
-    # Overwrite the original file
-    output_path = file_path
-    
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.writelines(new_lines)
-    
     if backup:
         print(f"Success! File updated to {style} (Original saved as {backup_path})")
     else:
@@ -143,11 +135,17 @@ def process_qmd_file(file_path, backup=False, style="titlecase"):
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Convert QMD file headers to Title Case or Lowercase.")
-    parser.add_argument("filename", help="The QMD file to process")
+    parser.add_argument("filenames", nargs="+", metavar="filename", help="The QMD file(s) to process")
     parser.add_argument("-b", "--backup", action="store_true", help="Create a backup of the original file")
     parser.add_argument("--to", choices=['titlecase', 'lowercase'], default='titlecase', 
                         help="Case style: 'titlecase' or 'lowercase'")
     
     args = parser.parse_args()
     
-    process_qmd_file(args.filename, backup=args.backup, style=args.to)
\ No newline at end of file
+    process = partial(process_qmd_file, backup=args.backup, style=args.to)
+    if len(args.filenames) == 1:
+        process(args.filenames[0])
+    else:
+        # Files are independent and the work is CPU-bound: one process per core
+        with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(args.filenames))) as pool:
+            list(pool.map(process, args.filenames))
\ No newline at end of file
@@ -8,7 +8,27 @@ import sys
 import os
 import re
 import argparse
-from pypdf import PdfReader, PdfWriter
+import hashlib
+import json
+import mmap
+import shutil
+import subprocess
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+# pypdf and PyMuPDF are imported inside the functions that use them, so
+# --help and config errors do not pay for loading a PDF library.
+
+# One comma-separated item of a page spec: 'last', 'N', 'N-M', or anything
+# else (captured in 'part' so it can be reported as malformed; empty is skipped)
+PAGE_TOKEN_PATTERN = re.compile(
+    r'\s*(?P<part>(?P<last>last)|(?P<a>\d+)(?:\s*-\s*(?P<b>\d+))?|[^,]*?)\s*(?:,|$)'
+)
+
+# Parsed configs are cached here, keyed by config path and invalidated on change
+CONFIG_CACHE_DIR = os.path.expanduser('~/.cache/splitpdf')
+
+# pypdf writes many small chunks per object; buffer them into few syscalls
+WRITE_BUFFER_SIZE = 1 << 20
 
 def read_split_config_from_file(config_file_path):
     """
@@ -24,13 +44,13 @@ def read_split_config_from_file(config_file_path):
     input_pdf_line = "" # Store the first line separately
     try:
         with open(config_file_path, 'r') as f:
-            lines = f.readlines()
+            first_line = f.readline()
 
             # Process first line for input PDF path
-            if not lines:
+            if not first_line:
                 print(f"Error: Configuration file '{config_file_path}' is empty.")
                 return None, None, None
-            input_pdf_line = lines[0].strip() # Store the first line
+            input_pdf_line = first_line.strip() # Store the first line
             if not input_pdf_line or not input_pdf_line.lower().endswith('.pdf'):
                 print(f"Error: First line in '{config_file_path}' must be a valid PDF file path.")
                 print(f"       Found: '{input_pdf_line}'")
@@ -38,21 +58,18 @@ def read_split_config_from_file(config_file_path):
             input_pdf_path = input_pdf_line # Assign if valid
 
             # Process subsequent lines for split configurations
-            for line_num, line in enumerate(lines[1:], 2): # Start line count from 2
+            for line_num, line in enumerate(f, 2): # Start line count from 2
                 original_line_text = line.strip()
                 original_lines.append(original_line_text) # Store the raw line
 
                 if not original_line_text or original_line_text.startswith('#'): # Skip processing for comments/blanks
                     continue
 
-                # Use regex to capture pages_spec and filename
-                match = re.match(r'([^:]+?)\s*:\s*(.+\.pdf)$', original_line_text, re.IGNORECASE)
-                if match:
-                    pages_spec = match.group(1).strip()
-                    output_filename = match.group(2).strip()
-                    if not pages_spec:
-                         print(f"Warning: Page specification missing on line {line_num}. Skipping: '{original_line_text}'")
-                         continue
+                # Split at the first ':' into pages_spec and filename
+                pages_spec, sep, output_filename = original_line_text.partition(':')
+                pages_spec = pages_spec.strip()
+                output_filename = output_filename.strip()
+                if sep and pages_spec and output_filename.lower().endswith('.pdf') and len(output_filename) > 4:
                     # Store original line index relative to the 'original_lines' list (starts at 0)
                     split_config.append({'filename': output_filename, 'pages': pages_spec, 'line_index': len(original_lines) - 1})
                 else:
@@ -71,64 +88,114 @@ def read_split_config_from_file(config_file_path):
 
     return input_pdf_path, split_config, original_lines
 
+def config_cache_path(config_file_path):
+    """Returns the cache file used for a config file (keyed by its absolute path)."""
+    key = hashlib.sha1(os.path.abspath(config_file_path).encode('utf-8')).hexdigest()
+    return os.path.join(CONFIG_CACHE_DIR, f"{key}.json")
+
+def load_cached_config(config_file_path):
+    """
+    Returns the cached (input_pdf_path, split_config, original_lines) for a config file,
+    or None if there is no cache entry or the file changed since it was written.
+    """
+    try:
+        st = os.stat(config_file_path)
+        with open(config_cache_path(config_file_path), 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached['mtime_ns'] != st.st_mtime_ns or cached['size'] != st.st_size:
+            return None
+        return cached['input_pdf_path'], cached['split_config'], cached['original_lines']
+    except (OSError, ValueError, KeyError):
+        return None
+
+def save_cached_config(config_file_path, input_pdf_path, split_config, original_lines):
+    """
+    Caches a parsed config keyed by the config file's mtime and size. Only configs that
+    parsed without warnings are cached, so a cache hit prints what a fresh parse would.
+    """
+    valid_indices = {entry['line_index'] for entry in split_config}
+    for idx, line_text in enumerate(original_lines):
+        if line_text and not line_text.startswith('#') and idx not in valid_indices:
+            return
+    if not split_config:
+        return
+    try:
+        st = os.stat(config_file_path)
+        os.makedirs(CONFIG_CACHE_DIR, exist_ok=True)
+        with open(config_cache_path(config_file_path), 'w', encoding='utf-8') as f:
+            json.dump({'mtime_ns': st.st_mtime_ns, 'size': st.st_size,
+                       'input_pdf_path': input_pdf_path, 'split_config': split_config,
+                       'original_lines': original_lines}, f)
+    except OSError:
+        pass # Caching is best-effort
+
 def parse_page_string(page_str, total_pages):
     """
     Parses a page string (e.g., "1-5", "6", "last") into a list of 0-based page indices
     and a user-friendly string representation.
     """
-    indices = set()
     page_str_orig = page_str # Keep original for output
     page_str = page_str.lower().strip()
-    friendly_parts = []
 
+    # Fast paths for the common single-item specs: 'last', 'N' and 'N-M'
     if page_str == 'last':
         if total_pages > 0:
-            indices.add(total_pages - 1)
-            friendly_parts.append(str(total_pages)) # User-friendly is 1-based
-        else:
-            raise ValueError("Cannot get 'last' page from an empty PDF.")
-    else:
-        parts = page_str.split(',')
-        for part in parts:
-            part = part.strip()
-            if not part:
-                continue
-
-            if part == 'last':
-                if total_pages > 0:
-                    indices.add(total_pages - 1)
-                    friendly_parts.append(str(total_pages))
-                else:
-                    raise ValueError("Cannot use 'last' with an empty PDF.")
-                continue
-
-            if '-' in part:
-                # Handle range
-                start_str, end_str = part.split('-', 1)
-                try:
-                    start_user = int(start_str.strip())
-                    end_user = int(end_str.strip())
-                    start_idx = start_user - 1
-                    end_idx = end_user - 1
-                    if start_idx < 0 or end_idx >= total_pages or start_idx > end_idx:
-                        raise ValueError(f"Invalid page range '{part}'. Max page is {total_pages}.")
-                    indices.update(range(start_idx, end_idx + 1))
-                    friendly_parts.append(f"{start_user}-{end_user}")
-                except ValueError:
-                    raise ValueError(f"Invalid page range format: '{part}'")
+            return [total_pages - 1], str(total_pages) # User-friendly is 1-based
+        raise ValueError("Cannot get 'last' page from an empty PDF.")
+    if page_str.isdecimal():
+        page_num_user = int(page_str)
+        if page_num_user < 1 or page_num_user > total_pages:
+            raise ValueError(f"Invalid page number '{page_num_user}'. Max page is {total_pages}.")
+        return [page_num_user - 1], str(page_num_user)
+    if ',' not in page_str:
+        start_str, sep, end_str = page_str.partition('-')
+        start_str, end_str = start_str.strip(), end_str.strip()
+        if sep and start_str.isdecimal() and end_str.isdecimal():
+            start_user, end_user = int(start_str), int(end_str)
+            if start_user < 1 or end_user > total_pages or start_user > end_user:
+                raise ValueError(f"Invalid page range '{page_str}'. Max page is {total_pages}.")
+            return list(range(start_user - 1, end_user)), f"{start_user}-{end_user}"
+
+    # General case: comma-separated items
+    selected = bytearray(total_pages) # 1 at each selected 0-based index
+    friendly_parts = []
+    for m in PAGE_TOKEN_PATTERN.finditer(page_str):
+        part = m.group('part')
+        if m.group('last'):
+            if total_pages > 0:
+                selected[total_pages - 1] = 1
+                friendly_parts.append(str(total_pages))
             else:
-                # Handle single page
-                try:
-                    page_num_user = int(part.strip())
-                    index = page_num_user - 1
-                    if index < 0 or index >= total_pages:
-                         raise ValueError(f"Invalid page number '{page_num_user}'. Max page is {total_pages}.")
-                    indices.add(index)
-                    friendly_parts.append(str(page_num_user))
-                except ValueError:
-                    raise ValueError(f"Invalid page number format: '{part}'")
-
-    sorted_indices = sorted(list(indices))
+                raise ValueError("Cannot use 'last' with an empty PDF.")
+        elif m.group('b'):
+            # Handle range
+            start_user = int(m.group('a'))
+            end_user = int(m.group('b'))
+            if start_user < 1 or end_user > total_pages or start_user > end_user:
+                raise ValueError(f"Invalid page range '{part}'. Max page is {total_pages}.")
+            selected[start_user - 1:end_user] = b'\x01' * (end_user - start_user + 1)
+            friendly_parts.append(f"{start_user}-{end_user}")
+        elif m.group('a'):
+            # Handle single page
+            page_num_user = int(m.group('a'))
+            if page_num_user < 1 or page_num_user > total_pages:
+                raise ValueError(f"Invalid page number '{page_num_user}'. Max page is {total_pages}.")
+            selected[page_num_user - 1] = 1
+            friendly_parts.append(str(page_num_user))
+        elif part:
+            # Anything else between commas is malformed
+            kind = "range" if '-' in part else "number"
+            raise ValueError(f"Invalid page {kind} format: '{part}'")
+
+    # Expand runs of selected pages in order; find() does the scanning in C
+    sorted_indices = []
+    start = selected.find(1)
+    while start != -1:
+        end = selected.find(0, start)
+        if end == -1:
+            end = total_pages
+        sorted_indices.extend(range(start, end))
+        start = selected.find(1, end)
     if not sorted_indices:
          raise ValueError(f"Page string '{page_str_orig}' resulted in no pages.")
 
@@ -138,19 +205,159 @@ def parse_page_string(page_str, total_pages):
     return sorted_indices, friendly_string
 
 
-def split_pdf_from_config(input_pdf_path, config, original_lines):
+def page_runs(page_indices):
+    """Collapses sorted 0-based indices into inclusive (start, end) runs."""
+    runs = []
+    start = prev = page_indices[0]
+    for index in page_indices[1:]:
+        if index != prev + 1:
+            runs.append((start, prev))
+            start = index
+        prev = index
+    runs.append((start, prev))
+    return runs
+
+
+def write_pdf(writer, output_filename):
+    """Serializes a PdfWriter to output_filename."""
+    with open(output_filename, "wb", buffering=WRITE_BUFFER_SIZE) as f_out:
+        writer.write(f_out)
+
+
+def run_qpdf(args):
+    """Runs qpdf and returns its stdout; exit status 3 means warnings only."""
+    result = subprocess.run(['qpdf'] + args, capture_output=True, text=True)
+    if result.returncode not in (0, 3):
+        raise RuntimeError(result.stderr.strip() or f"qpdf exited with status {result.returncode}")
+    return result.stdout
+
+
+def write_qpdf_split(input_pdf_path, page_indices, output_filename):
+    """Writes the selected pages with qpdf; the PDF work happens out of process."""
+    page_spec = ",".join(str(start + 1) if start == end else f"{start + 1}-{end + 1}"
+                         for start, end in page_runs(page_indices))
+    run_qpdf([input_pdf_path, '--pages', '.', page_spec, '--', output_filename])
+
+
+def remove_temp_output(path):
+    """Deletes a temporary output file; cleanup failures are not fatal."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def write_bytes(data, output_filename):
+    """Writes an already-serialized PDF to output_filename."""
+    with open(output_filename, "wb") as f_out:
+        f_out.write(data)
+
+
+def build_pymupdf_split(src, page_indices):
+    """Copies the selected pages of a PyMuPDF document; returns the new PDF's bytes."""
+    import pymupdf
+    dst = pymupdf.open()
+    try:
+        for start, end in page_runs(page_indices):
+            dst.insert_pdf(src, from_page=start, to_page=end)
+        return dst.tobytes(garbage=3, deflate=True)
+    finally:
+        dst.close()
+
+
+def build_pypdf_split(reader, page_indices):
+    """Returns a PdfWriter holding the selected pages of a PdfReader."""
+    from pypdf import PdfWriter
+    # Contiguous selections go in as a single (start, stop) slice
+    first, last = page_indices[0], page_indices[-1]
+    if last - first + 1 == len(page_indices):
+        pages = (first, last + 1)
+    else:
+        pages = page_indices
+    writer = PdfWriter()
+    writer.append(fileobj=reader, pages=pages, import_outline=False)
+    return writer
+
+
+def open_pdf_reader(input_pdf_path):
+    """
+    Opens a PdfReader over a read-only mmap of the input PDF.
+    Given a path, pypdf would copy the whole file into a BytesIO; the mapping
+    is paged in by the OS on demand and shared by all --jobs workers.
+    """
+    from pypdf import PdfReader
+    with open(input_pdf_path, 'rb') as fh:
+        mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+    if hasattr(mmap, 'MADV_RANDOM'):
+        mm.madvise(mmap.MADV_RANDOM) # xref resolution seeks all over the file
+    return PdfReader(mm, strict=False)
+
+
+# (backend, source document) of a --jobs worker process, set by init_split_worker
+worker_source = None
+
+def init_split_worker(backend, input_pdf_path):
+    """Opens the input PDF once per worker process."""
+    global worker_source
+    if backend == "pymupdf":
+        import pymupdf
+        worker_source = (backend, pymupdf.open(input_pdf_path))
+    else:
+        worker_source = (backend, open_pdf_reader(input_pdf_path))
+
+
+def render_split(page_indices, output_filename):
+    """Builds and writes one output PDF inside a --jobs worker process."""
+    backend, source = worker_source
+    if backend == "pymupdf":
+        write_bytes(build_pymupdf_split(source, page_indices), output_filename)
+    else:
+        write_pdf(build_pypdf_split(source, page_indices), output_filename)
+
+
+def split_pdf_from_config(input_pdf_path, config, original_lines, backend="pymupdf", jobs=1):
     """
     Splits the input PDF based on the configuration list.
     Prints status line by line based on original_lines.
+    backend is "pymupdf" (default), "qpdf" (external command) or "pypdf"; the
+    first two fall back to pypdf if not installed.
+    With jobs > 1, outputs are built and written by that many worker processes
+    (qpdf already runs out of process, so it always uses threads).
     """
     files_created_count = 0
     total_pages_in_input = 0
     # Create a mapping from original line index to config entry for easy lookup
     config_map = {entry['line_index']: entry for entry in config}
 
+    if backend == "pymupdf":
+        try:
+            # PyMuPDF does PDF parsing/writing in C (MuPDF); much faster than pypdf.
+            import pymupdf
+        except ImportError:
+            print("Note: PyMuPDF is not installed; using the pypdf backend.")
+            backend = "pypdf"
+    if backend == "qpdf" and shutil.which("qpdf") is None:
+        print("Note: qpdf is not installed; using the pypdf backend.")
+        backend = "pypdf"
+    use_processes = jobs > 1 and backend != "qpdf"
+
+    src = None
+    temp_targets = set() # temporary outputs not yet renamed into place
     try:
-        reader = PdfReader(input_pdf_path)
-        total_pages_in_input = len(reader.pages)
+        if backend == "pymupdf":
+            if not os.path.exists(input_pdf_path):
+                raise FileNotFoundError(input_pdf_path)
+            src = pymupdf.open(input_pdf_path)
+            total_pages_in_input = src.page_count
+        elif backend == "qpdf":
+            if not os.path.exists(input_pdf_path):
+                raise FileNotFoundError(input_pdf_path)
+            total_pages_in_input = int(run_qpdf(['--show-npages', input_pdf_path]))
+        else:
+            # Invariant: the input is opened and parsed exactly once here and
+            # shared by every split entry below; never reopen it per entry.
+            reader = open_pdf_reader(input_pdf_path)
+            total_pages_in_input = len(reader.pages)
 
         if total_pages_in_input == 0:
             print(f"Error: Input PDF '{input_pdf_path}' appears to be empty.")
@@ -158,54 +365,130 @@ def split_pdf_from_config(input_pdf_path, config, original_lines):
 
         print(f"Processing split instructions for '{input_pdf_path}' ({total_pages_in_input} pages):")
 
-        for idx, line_text in enumerate(original_lines):
-            if not line_text or line_text.startswith('#'):
-                # print(line_text) # Optionally show comments/blanks
-                continue
-
-            entry = config_map.get(idx)
-            if not entry:
-                # This line had an invalid format during parsing
-                print(line_text)
-                print("  Error: Invalid line format.")
-                continue
-
-            # Valid config entry exists for this line
-            output_filename = entry['filename']
-            page_str = entry['pages']
-            error_message = None
-            num_split_pages = 0
-
-            try:
-                page_indices, friendly_page_str = parse_page_string(page_str, total_pages_in_input)
-
-                if not page_indices:
-                    raise ValueError("Page spec resulted in no pages.")
-
-                writer = PdfWriter()
-                for index in page_indices:
-                    writer.add_page(reader.pages[index])
-
-                with open(output_filename, "wb") as f_out:
-                    writer.write(f_out)
-
-                num_split_pages = len(page_indices)
-                files_created_count += 1
-                # Success!
-
-            except ValueError as e:
-                error_message = f"Parsing page spec '{page_str}': {e}"
-            except IndexError:
-                 error_message = "Page index out of range. Check page numbers."
-            except Exception as e:
-                 error_message = f"Creating '{output_filename}': {e}"
-
-            # Print the original line and status
-            if error_message:
-                print(line_text)
-                print(f"  Error: {error_message}")
-            else:
-                print(f"{line_text} ✓") # Append checkmark on success
+        # The source is shared by every entry; pypdf already memoizes its
+        # PageObjects, so memoize the parsed page specs as well.
+        parsed_specs = {}
+
+        # With jobs == 1, pages are copied out of the shared source on this
+        # thread and only the pypdf serialization / the disk write of each
+        # output run in a thread pool (qpdf runs entirely in those threads).
+        # With jobs > 1, each worker process opens the input once and renders
+        # whole outputs.
+        if use_processes:
+            max_workers = min(jobs, len(config) or 1)
+            pool = ProcessPoolExecutor(max_workers=max_workers,
+                                       initializer=init_split_worker,
+                                       initargs=(backend, input_pdf_path))
+        else:
+            max_workers = min(8, len(config) or 1)
+            pool = ThreadPoolExecutor(max_workers=max_workers)
+        # Bound how many built-but-unwritten outputs are held in memory
+        pending = threading.BoundedSemaphore(2 * max_workers)
+        results = [] # (line_text, output_filename, error_message, future, note, write_target)
+        # (temporary file, output path) for outputs written beside their final
+        # name: the input PDF itself, or a path an earlier line already writes.
+        # They are renamed in config order once the pool is done, so the last
+        # line naming a file wins, as when outputs were written one by one.
+        deferred_replaces = []
+        # Normalized paths some job writes to, starting with the input PDF
+        claimed_paths = {os.path.normcase(os.path.realpath(input_pdf_path))}
+        with pool:
+            for idx, line_text in enumerate(original_lines):
+                if not line_text or line_text.startswith('#'):
+                    # print(line_text) # Optionally show comments/blanks
+                    continue
+
+                entry = config_map.get(idx)
+                if not entry:
+                    # This line had an invalid format during parsing
+                    results.append((line_text, None, "Invalid line format.", None, "", None))
+                    continue
+
+                # Valid config entry exists for this line
+                output_filename = entry['filename']
+                page_str = entry['pages']
+                error_message = None
+                future = None
+                note = ""
+                write_target = output_filename
+
+                try:
+                    if page_str not in parsed_specs:
+                        parsed_specs[page_str] = parse_page_string(page_str, total_pages_in_input)
+                    page_indices, friendly_page_str = parsed_specs[page_str]
+
+                    if not page_indices:
+                        raise ValueError("Page spec resulted in no pages.")
+
+                    output_key = os.path.normcase(os.path.realpath(output_filename))
+                    if (output_key in claimed_paths
+                            or (os.path.exists(output_filename)
+                                and os.path.samefile(input_pdf_path, output_filename))):
+                        # The input is still open/mapped and read by later entries,
+                        # or another job writes the same file concurrently
+                        write_target = f"{output_filename}.splitPDF-tmp{idx}"
+
+                    pending.acquire()
+                    try:
+                        if len(page_indices) == total_pages_in_input:
+                            # Whole document: a byte copy, no PDF library needed
+                            future = pool.submit(shutil.copyfile, input_pdf_path, write_target)
+                            note = " (full-copy fast path)"
+                        elif backend == "qpdf":
+                            future = pool.submit(write_qpdf_split, input_pdf_path,
+                                                 page_indices, write_target)
+                        elif use_processes:
+                            future = pool.submit(render_split, page_indices, write_target)
+                        elif backend == "pymupdf":
+                            # MuPDF objects must stay on one thread: build and
+                            # serialize here, hand only the bytes to the pool
+                            data = build_pymupdf_split(src, page_indices)
+                            future = pool.submit(write_bytes, data, write_target)
+                        else:
+                            writer = build_pypdf_split(reader, page_indices)
+                            future = pool.submit(write_pdf, writer, write_target)
+                    except BaseException:
+                        pending.release()
+                        raise
+                    future.add_done_callback(lambda _: pending.release())
+                    claimed_paths.add(output_key)
+                    if write_target != output_filename:
+                        temp_targets.add(write_target)
+
+                except ValueError as e:
+                    error_message = f"Parsing page spec '{page_str}': {e}"
+                except IndexError:
+                     error_message = "Page index out of range. Check page numbers."
+                except Exception as e:
+                     error_message = f"Creating '{output_filename}': {e}"
+
+                results.append((line_text, output_filename, error_message, future, note, write_target))
+
+            # Print the original lines and status in config order
+            for line_text, output_filename, error_message, future, note, write_target in results:
+                if future is not None:
+                    try:
+                        future.result()
+                        files_created_count += 1
+                        # Success!
+                        if write_target != output_filename:
+                            deferred_replaces.append((write_target, output_filename))
+                    except Exception as e:
+                        error_message = f"Creating '{output_filename}': {e}"
+                        if write_target in temp_targets:
+                            remove_temp_output(write_target)
+                            temp_targets.discard(write_target)
+
+                if error_message:
+                    print(line_text)
+                    print(f"  Error: {error_message}")
+                else:
+                    print(f"{line_text} ✓{note}") # Append checkmark on success
+
+        # Every worker has finished reading the input and writing by now
+        for write_target, output_filename in deferred_replaces:
+            os.replace(write_target, output_filename)
+            temp_targets.discard(write_target)
 
     except FileNotFoundError:
         print(f"Error: Input PDF not found at '{input_pdf_path}'")
@@ -213,6 +496,12 @@ def split_pdf_from_config(input_pdf_path, config, original_lines):
     except Exception as e:
         print(f"An unexpected error occurred reading the input PDF: {e}")
         return # Cannot proceed
+    finally:
+        if src is not None:
+            src.close()
+        # Never leave half-written or unrenamed outputs beside the user's PDFs
+        for write_target in temp_targets:
+            remove_temp_output(write_target)
 
     # --- Final Summary ---
     if files_created_count > 0:
@@ -248,18 +537,36 @@ last: file3.pdf
     # Changed to a single positional argument for the config file
     parser.add_argument('config_file',
                         help='Path to the split configuration file (e.g., split.txt).')
+    parser.add_argument('--backend', choices=['pymupdf', 'qpdf', 'pypdf'], default='pymupdf',
+                        help='PDF engine to use (default: pymupdf); pymupdf and qpdf fall back to pypdf if not installed.')
+    parser.add_argument('--jobs', type=int, default=1, metavar='N',
+                        help='With N > 1, build and write outputs in N worker processes; with 1 '
+                             '(default), pages are copied on the main thread and outputs are '
+                             'written by up to 8 threads. The qpdf backend always runs one qpdf '
+                             'per output on up to 8 threads and ignores N.')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Always re-read the config file instead of using the parsed-config cache.')
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error(f"--jobs must be at least 1 (got {args.jobs})")
     # -----------------------
 
     config_file_path = args.config_file
 
     print(f"Reading split configuration from: '{config_file_path}'")
-    input_pdf, split_config, original_config_lines = read_split_config_from_file(config_file_path)
+    cached = None if args.no_cache else load_cached_config(config_file_path)
+    if cached is not None:
+        input_pdf, split_config, original_config_lines = cached
+    else:
+        input_pdf, split_config, original_config_lines = read_split_config_from_file(config_file_path)
+        if input_pdf is not None and not args.no_cache:
+            save_cached_config(config_file_path, input_pdf, split_config, original_config_lines)
 
     # Proceed only if both input_pdf and split_config were successfully read
     if input_pdf is not None:
         # Pass original lines to the split function
-        split_pdf_from_config(input_pdf, split_config, original_config_lines)
+        split_pdf_from_config(input_pdf, split_config, original_config_lines,
+                              backend=args.backend, jobs=args.jobs)
     else:
         # Error message already printed by read_split_config_from_file
         sys.exit(1)
@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 import socket
-import requests
 import subprocess
-import re
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # --- CONFIGURATION ---
@@ -10,16 +11,6 @@ from datetime import datetime
 NOTE_TITLE = "Longhai Li’s Computers’ IPs"
 # ---------------------
 
-def escape_for_applescript(text):
-    """Escapes text to be safely used inside an AppleScript string."""
-    text = text.replace('\\', '\\\\') # Must be first
-    text = text.replace('"', '\\"')   # Escape double quotes
-    return text
-
-def strip_html(text):
-    """Removes HTML tags from a string."""
-    return re.sub('<[^<]+?>', '', text)
-
 def get_computer_name():
     """Gets the user-friendly computer name from macOS using scutil."""
     try:
@@ -31,9 +22,9 @@ def get_computer_name():
 def get_public_ip():
     """Gets the public IP address from an external service."""
     try:
-        ip = requests.get('https://api.ipify.org', timeout=5).text.strip()
-        return ip
-    except requests.RequestException:
+        with urllib.request.urlopen('https://api.ipify.org', timeout=5) as response:
+            return response.read().decode().strip()
+    except (urllib.error.URLError, OSError):  # includes timeouts
         return "Could not fetch public IP"
 
 def get_local_ip():
@@ -67,65 +58,89 @@ def get_local_ip():
         s.close()
     return IP
 
-def get_apple_note_content(note_title):
-    """Gets the body of a specific Apple Note using AppleScript."""
-    safe_title = escape_for_applescript(note_title)
-    script = f'''
-    tell application "Notes"
-        tell account "iCloud"
-            if not (exists folder "Computers") then
-                return ""
+# Reads the note, drops the lines for this computer, appends the new line and
+# writes it back, all in one osascript run. Arguments: title, new line, prefix.
+# AppleScript's "starts with" ignores case, matching the old lower() comparison.
+UPDATE_NOTE_SCRIPT = '''
+on stripTags(theText)
+    -- Same as re.sub('<[^<]+?>', '', theText)
+    set outText to ""
+    set pending to ""
+    set inTag to false
+    repeat with c in characters of theText
+        set c to contents of c
+        if inTag then
+            if c is "<" then
+                set outText to outText & pending
+                set pending to "<"
+            else if c is ">" and pending is not "<" then
+                set pending to ""
+                set inTag to false
+            else
+                set pending to pending & c
             end if
-            tell folder "Computers"
-                if (exists note "{safe_title}") then
-                    return body of note "{safe_title}"
-                else
-                    return ""
-                end if
-            end tell
-        end tell
-    end tell
-    '''
-    try:
-        result = subprocess.run(["osascript", "-e", script], check=True, capture_output=True, text=True)
-        return result.stdout.strip()
-    except subprocess.CalledProcessError as e:
-        error_message = e.stderr.decode()
-        print(f"Error reading note: {error_message}")
-        if "Not authorized" in error_message or "access" in error_message:
-            print("\n--- PERMISSION ERROR DETECTED ---")
-            print("macOS is likely blocking this script from controlling the Notes app.")
-            print("Please go to System Settings > Privacy & Security > Automation.")
-            print("Find the application you are running this script from (e.g., Terminal) and ensure 'Notes' is checked ON.")
-            print("---------------------------------")
-        return ""
+        else if c is "<" then
+            set pending to "<"
+            set inTag to true
+        else
+            set outText to outText & c
+        end if
+    end repeat
+    return outText & pending
+end stripTags
 
-def update_apple_note(note_title, note_body):
-    """Updates the body of a specific Apple Note using AppleScript."""
-    safe_title = escape_for_applescript(note_title)
-    safe_body = escape_for_applescript(note_body)
-    script = f'''
+on trimLeft(theText)
+    repeat while theText is not "" and (character 1 of theText is in {space, tab, character id 160})
+        if (count of theText) is 1 then return ""
+        set theText to text 2 thru -1 of theText
+    end repeat
+    return theText
+end trimLeft
+
+on run argv
+    set noteTitle to item 1 of argv
+    set newLine to item 2 of argv
+    set searchPrefix to item 3 of argv
     tell application "Notes"
         tell account "iCloud"
             if not (exists folder "Computers") then
-                make new folder with properties {{name:"Computers"}}
+                make new folder with properties {name:"Computers"}
             end if
             tell folder "Computers"
-                if not (exists note "{safe_title}") then
-                    make new note with properties {{name:"{safe_title}", body:"{safe_body}"}}
-                else
-                    set theNote to note "{safe_title}"
-                    set body of theNote to "{safe_body}"
+                if not (exists note noteTitle) then
+                    make new note with properties {name:noteTitle, body:newLine}
+                    return
                 end if
+                set theNote to note noteTitle
+                set oldBody to body of theNote
             end tell
         end tell
     end tell
-    '''
+    set keptLines to {}
+    repeat with p in paragraphs of oldBody
+        set p to contents of p
+        if not (my trimLeft(my stripTags(p)) starts with searchPrefix) then
+            set end of keptLines to p
+        end if
+    end repeat
+    set end of keptLines to newLine
+    set AppleScript's text item delimiters to linefeed
+    set newBody to keptLines as text
+    set AppleScript's text item delimiters to ""
+    tell application "Notes" to set body of theNote to newBody
+end run
+'''
+
+def update_apple_note(note_title, new_line, search_prefix):
+    """Replaces this computer's line in an Apple Note with a single osascript call."""
     try:
-        subprocess.run(["osascript", "-e", script], check=True, capture_output=True)
-        print(f"Successfully updated note: '{safe_title}'")
+        subprocess.run(
+            ["osascript", "-e", UPDATE_NOTE_SCRIPT, note_title, new_line, search_prefix],
+            check=True, capture_output=True, text=True
+        )
+        print(f"Successfully updated note: '{note_title}'")
     except subprocess.CalledProcessError as e:
-        error_message = e.stderr.decode()
+        error_message = e.stderr
         print(f"Error updating note: {error_message}")
         if "Not authorized" in error_message or "access" in error_message:
             print("\n--- PERMISSION ERROR DETECTED ---")
@@ -135,9 +150,14 @@ def update_apple_note(note_title, note_body):
             print("---------------------------------")
 
 if __name__ == "__main__":
-    computer_name = get_computer_name()
-    public_ip = get_public_ip()
-    local_ip = get_local_ip() # Get the local IP
+    # Independent lookups (scutil, HTTP request, ipconfig): run them side by side
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        name_future = executor.submit(get_computer_name)
+        public_ip_future = executor.submit(get_public_ip)
+        local_ip_future = executor.submit(get_local_ip) # Get the local IP
+        computer_name = name_future.result()
+        public_ip = public_ip_future.result()
+        local_ip = local_ip_future.result()
     current_date = datetime.now().strftime("%Y-%m-%d %I:%M %p")
 
     # Print the fetched information to the terminal for debugging
@@ -150,18 +170,6 @@ if __name__ == "__main__":
     # Updated format to include the local IP address
     new_line_for_this_mac = f"{computer_name}: {public_ip} (Local: {local_ip}), {current_date}"
     
-    existing_content = get_apple_note_content(NOTE_TITLE)
-    existing_lines = existing_content.splitlines()
-    
-    search_prefix = (computer_name + ":").lower()
-    updated_lines = []
-    for line in existing_lines:
-        clean_line = strip_html(line).strip().lower()
-        if not clean_line.startswith(search_prefix):
-            updated_lines.append(line)
-
-    updated_lines.append(new_line_for_this_mac)
-    new_note_content = "\n".join(updated_lines)
-    
-    update_apple_note(NOTE_TITLE, new_note_content)
+    # Lines whose text (tags stripped) starts with "<computer name>:" are replaced
+    update_apple_note(NOTE_TITLE, new_line_for_this_mac, computer_name + ":")
 
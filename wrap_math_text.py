@@ -6,21 +6,23 @@ exec "$(dirname "$0")/.venv/bin/python" "$0" "$@"
 import re
 import sys
 import os
+import shutil
+from functools import lru_cache
 
 # --- CONFIGURATION ---
 
-BLACKLIST = {
+BLACKLIST = frozenset({
     'matrix', 'bmatrix', 'pmatrix', 'vmatrix', 
     'aligned', 'split', 'cases', 'array', 'equation', 
     'align', 'gather', 'frac', 'sqrt', 'sum', 'prod', 
     'lim', 'sin', 'cos', 'tan', 'log', 'ln', 'exp', 
     'det', 'sup', 'inf', 'min', 'max', 'arg', 'var', 'cov', 'cor',
     'hat', 'bar', 'tilde', 'vec', 'mathbf', 'mathrm', 'text', 'textit', 'textbf'
-}
+})
 
-TEXT_COMMANDS = {'text', 'mathrm', 'mathbf', 'textit', 'textbf', 'sf', 'it', 'rm', 'label', 'tag', 'mbox'}
+TEXT_COMMANDS = frozenset({'text', 'mathrm', 'mathbf', 'textit', 'textbf', 'sf', 'it', 'rm', 'label', 'tag', 'mbox'})
 
-KNOWN_ACRONYMS = {
+KNOWN_ACRONYMS = frozenset({
     'MSE', 'SSR', 'SSE', 'SST', 'MSA', 'MSB', 'MSC', 
     'MLE', 'OLS', 'GLS', 'WLS', 'BLUE', 
     'PDF', 'CDF', 'PMF', 'MGF', 
@@ -28,146 +30,240 @@ KNOWN_ACRONYMS = {
     'IID', 'RNG', 'SD', 'SE', 'CV',
     'ANOVA', 'MANOVA', 'ANCOVA', 
     'LRT', 'GLM', 'GAM', 'ROC', 'AUC'
-}
+})
+
+# One lookup classifies a candidate word (BLACKLIST wins over acronyms)
+SKIP, ACRONYM, LONG_WORD = 'skip', 'acronym', 'long word'
+WORD_KIND = {**dict.fromkeys(KNOWN_ACRONYMS, ACRONYM), **dict.fromkeys(BLACKLIST, SKIP)}
+
+# Master Regex: Code blocks OR Display Math OR Inline Math
+MASTER_RE = re.compile(r'(?s)(`{1,3}.+?`{1,3})|(?<!\\)(\$\$)(.+?)(?<!\\)\$\$|(?<!\\)(\$)(?!\s)([^$\n`]+?)(?<!\s)(?<!\\)\$')
+
+# Word Regex Strategy:
+# 1. Look for words of 3+ letters followed immediately by '(' (Functions)
+# 2. OR Look for words of 2+ letters (Candidates for Acronyms)
+# 3. We use \b to ensure we don't cut inside words.
+# 4. We DO NOT match subscripts/superscripts. We leave them behind.
+WORD_RE = re.compile(r'(?<!\\)\b(?:([a-zA-Z]{3,})(?=\s*\()|([a-zA-Z0-9]{2,}))\b')
+
+# Any WORD_RE hit needs two adjacent alphanumerics; blocks without one
+# (e.g. $x$, $x_i$) can skip the word scan entirely
+CANDIDATE_RE = re.compile(r'[a-zA-Z0-9]{2}')
+
+BRACE_RE = re.compile(r'[{}]')
+
+CALL_PAREN_RE = re.compile(r'\s*\(')
 
 class GlobalReplacer:
-    def __init__(self):
+    def __init__(self, text):
         self.interactive = True
         self.count = 0
+        self.text = text
+        # (start, end, word, delimiter, block_start, block_end) per word that
+        # qualifies for wrapping; all offsets index into self.text
+        self.candidates = []
+
+    def collect(self, match):
+        # Record the wrappable words of a MASTER_RE match (code spans have none).
+        # The math content is scanned in place, never sliced out of the text.
+        if match.group(2): collect_in_math_block(self.text, match.group(2), *match.span(3), self.candidates)
+        elif match.group(4): collect_in_math_block(self.text, match.group(4), *match.span(5), self.candidates)
+
+    def review(self):
+        # One prompt per distinct word; returns the accepted candidates in file order
+        by_word = {}
+        for cand in self.candidates:
+            by_word.setdefault(cand[2], []).append(cand)
 
-    def process_match(self, match):
-        if match.group(1): return match.group(1) 
-        if match.group(2): return replace_in_math_block(match.group(2), match.group(3), self) 
-        if match.group(4): return replace_in_math_block(match.group(4), match.group(5), self) 
-        return match.group(0)
-
-def is_inside_text_command(full_string, current_index):
-    # Backward scan to see if we are enclosed in {} of a text command
-    balance = 0
-    i = current_index - 1
-    while i >= 0:
-        char = full_string[i]
-        if char == '}': 
-            balance += 1
-        elif char == '{':
-            if balance > 0: 
-                balance -= 1
+        accepted = []
+        for word, occurrences in by_word.items():
+            if not self.interactive:
+                accepted.extend(occurrences)
+            elif len(occurrences) == 1:
+                if confirm_occurrence(occurrences[0], self):
+                    accepted.append(occurrences[0])
             else:
-                # Found the opening brace of our current scope
-                cmd_end = i
-                cmd_start = i - 1
-                # Skip backwards over spaces
-                while cmd_start >= 0 and full_string[cmd_start].isspace(): 
-                    cmd_start -= 1
-                # Scan backwards over letters to get command name
-                while cmd_start >= 0 and full_string[cmd_start].isalpha(): 
-                    cmd_start -= 1
-                
-                # Check if the command found is in our ignore list (e.g., \text, \mathrm)
-                command_name = full_string[cmd_start+1 : cmd_end].strip()
-                return command_name in TEXT_COMMANDS
-        i -= 1
-    return False
-
-def replace_in_math_block(delimiter, content, state):
-    # Regex Strategy:
-    # 1. Look for words of 3+ letters followed immediately by '(' (Functions)
-    # 2. OR Look for words of 2+ letters (Candidates for Acronyms)
-    # 3. We use \b to ensure we don't cut inside words.
-    # 4. We DO NOT match subscripts/superscripts. We leave them behind.
-    word_pattern = r'(?<!\\)\b(?:([a-zA-Z]{3,})(?=\s*\()|([a-zA-Z0-9]{2,}))\b'
-
-    def word_sub(m):
-        full_match = m.group(0)
-        base_word = m.group(1) if m.group(1) else m.group(2)
-        
-        # 1. Safety Checks
-        if base_word in BLACKLIST: return full_match
-        
-        # Check if already wrapped (e.g. \text{MSE})
-        if is_inside_text_command(content, m.start()): 
-            return full_match
-
-        # 2. Priority 1: Known Acronyms (Always wrap)
-        if base_word in KNOWN_ACRONYMS:
-            return perform_replacement(full_match, content, delimiter, m.start(), state)
-
-        # 3. Priority 2: Functions and Long Words
-        is_function = False
-        next_char_idx = m.end()
-        # Look ahead for '(' to confirm function status
-        if next_char_idx < len(content):
-            rest = content[next_char_idx:]
-            if rest.lstrip().startswith('('):
-                is_function = True
-
-        # Logic: 
-        # - Wrap if it is a function: Var(x)
-        # - Wrap if it is a long word (4+ chars): ANOVA
-        # - Ignore if it is short (2-3 chars) and NOT in known list: ABC, xy
-        if is_function or (len(base_word) >= 4 and base_word.isalpha()):
-            return perform_replacement(full_match, content, delimiter, m.start(), state)
-
-        return full_match
-
-    def perform_replacement(word, content, delimiter, start_pos, state):
-        replacement = f"\\text{{{word}}}"
-        
-        if not state.interactive:
-            state.count += 1
-            return replacement
-
-        print(f"\n{'-'*50}")
-        # Preview context
-        start_preview = max(0, start_pos - 20)
-        end_preview = min(len(content), start_pos + len(word) + 25)
-        preview_snippet = "..." + content[start_preview:end_preview] + "..."
-        
-        print(f"CONTEXT: {delimiter} {preview_snippet} {delimiter}")
-        print(f"Found  : {word}")
-        print(f"Change : {replacement}")
-        
-        while True:
-            ans = input("Wrap? [y]es / [n]o / [a]ll / [q]uit: ").lower().strip()
-            if ans == 'y':
-                state.count += 1
-                return replacement
-            elif ans == 'n':
-                return word
-            elif ans == 'a':
-                state.interactive = False
-                state.count += 1
-                return replacement
-            elif ans == 'q':
-                sys.exit(0)
-
-    new_content = re.sub(word_pattern, word_sub, content)
-    return delimiter + new_content + delimiter
+                accepted.extend(confirm_word(word, occurrences, self))
+        accepted.sort()
+        self.count = len(accepted)
+        return accepted
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: ./wrap_math_text.py <filename.qmd>")
-        sys.exit(1)
-    file_path = sys.argv[1]
-    if not os.path.exists(file_path):
-        print(f"Error: File '{file_path}' not found.")
-        sys.exit(1)
+def print_candidate(text, cand, found):
+    start, end, word, delimiter, block_start, block_end = cand
+    print(f"\n{'-'*50}")
+    # Preview context
+    start_preview = max(block_start, start - 20)
+    end_preview = min(block_end, start + len(word) + 25)
+    preview_snippet = "..." + text[start_preview:end_preview] + "..."
+
+    print(f"CONTEXT: {delimiter} {preview_snippet} {delimiter}")
+    print(f"Found  : {found}")
+    print(f"Change : \\text{{{word}}}")
+
+def confirm_occurrence(cand, state):
+    print_candidate(state.text, cand, cand[2])
+    while True:
+        ans = input("Wrap? [y]es / [n]o / [a]ll / [q]uit: ").lower().strip()
+        if ans == 'y':
+            return True
+        elif ans == 'n':
+            return False
+        elif ans == 'a':
+            state.interactive = False
+            return True
+        elif ans == 'q':
+            sys.exit(0)
+
+def confirm_word(word, occurrences, state):
+    # Decide all occurrences of word at once; [r]eview falls back to one prompt each
+    blocks = len({cand[4] for cand in occurrences})
+    print_candidate(state.text, occurrences[0], f"{word} ({len(occurrences)} occurrences in {blocks} block{'s' if blocks > 1 else ''})")
+    while True:
+        ans = input("Wrap all? [y]es / [n]o / [r]eview each / [a]ll words / [q]uit: ").lower().strip()
+        if ans == 'y':
+            return occurrences
+        elif ans == 'n':
+            return []
+        elif ans == 'r':
+            accepted = []
+            for cand in occurrences:
+                if not state.interactive or confirm_occurrence(cand, state):
+                    accepted.append(cand)
+            return accepted
+        elif ans == 'a':
+            state.interactive = False
+            return occurrences
+        elif ans == 'q':
+            sys.exit(0)
+
+def command_name_before(full_string, brace_index, start=0):
+    # Command name owning the '{' at brace_index (e.g. 'text' for \text {...}),
+    # looking no further back than start
+    cmd_start = brace_index - 1
+    # Skip backwards over spaces
+    while cmd_start >= start and full_string[cmd_start].isspace(): 
+        cmd_start -= 1
+    # Scan backwards over letters to get command name
+    while cmd_start >= start and full_string[cmd_start].isalpha(): 
+        cmd_start -= 1
+    return full_string[cmd_start+1 : brace_index].strip()
+
+def text_command_mask(full_string, start=0, end=None):
+    # One forward pass over the braces of full_string[start:end]: mask[i] is 1
+    # when the innermost {} open before offset start+i belongs to a text
+    # command (e.g. \text, \mathrm), so each word needs only an O(1) lookup
+    # instead of a backward scan.
+    if end is None:
+        end = len(full_string)
+    mask = bytearray(end - start)
+    stack = []  # per open brace: does it belong to a text command?
+    pos = 0
+    for m in BRACE_RE.finditer(full_string, start, end):
+        i = m.start() - start
+        if stack and stack[-1]:
+            mask[pos:i+1] = b'\x01' * (i + 1 - pos)
+        if full_string[m.start()] == '{':
+            stack.append(command_name_before(full_string, m.start(), start) in TEXT_COMMANDS)
+        elif stack:  # a stray '}' closes nothing
+            stack.pop()
+        pos = i + 1
+    if stack and stack[-1]:
+        mask[pos:] = b'\x01' * (len(mask) - pos)
+    return mask
+
+@lru_cache(maxsize=4096)
+def classify_word(word):
+    # Context-free part of the decision, memoized since the same words recur
+    # across a document: SKIP, ACRONYM, LONG_WORD, or None for short words
+    # that are wrapped only when used as a function
+    kind = WORD_KIND.get(word)
+    if kind is None and len(word) >= 4 and word.isalpha():
+        return LONG_WORD
+    return kind
+
+def should_wrap(m, text, in_text_command, block_start, block_end):
+    # Decide whether a WORD_RE match in text[block_start:block_end] should be
+    # wrapped in \text{}; in_text_command is that block's text_command_mask
+    base_word = m.group(1) if m.group(1) else m.group(2)
+    kind = classify_word(base_word)
+    
+    # 1. Safety Checks
+    if kind is SKIP: return False
+    
+    # Check if already wrapped (e.g. \text{MSE})
+    if in_text_command[m.start() - block_start]: 
+        return False
+
+    # 2. Known Acronyms and Long Words (4+ chars, e.g. ANOVA): always wrap
+    if kind is not None:
+        return True
+
+    # 3. Short words (2-3 chars) NOT in known list, e.g. ABC, xy: wrap only
+    # if it is a function, e.g. Var(x). Look ahead for '(' in place,
+    # without copying the rest of the block for every word
+    return CALL_PAREN_RE.match(text, m.end(), block_end) is not None
+
+def collect_in_math_block(text, delimiter, block_start, block_end, candidates):
+    # Append every word of text[block_start:block_end] that should be wrapped
+    # to candidates. The block is searched in place via pos/endpos; the
+    # character before it is always its opening '$', which the word pattern's
+    # \b and (?<!\\) treat exactly like the start of a string.
+    if not CANDIDATE_RE.search(text, block_start, block_end):
+        return
+
+    in_text_command = text_command_mask(text, block_start, block_end)
+
+    for m in WORD_RE.finditer(text, block_start, block_end):
+        if should_wrap(m, text, in_text_command, block_start, block_end):
+            start, end = m.span()
+            candidates.append((start, end, m.group(0), delimiter, block_start, block_end))
+
+def process_file(file_path):
     with open(file_path, 'r', encoding='utf-8') as f: full_content = f.read()
     
-    # Backup
-    with open(file_path + ".bak", 'w', encoding='utf-8') as f: f.write(full_content)
+    # Backup: copied file-to-file (sendfile/fcopyfile) rather than re-encoding
+    # the text. Not a hardlink, since the file is later rewritten in place.
+    shutil.copyfile(file_path, file_path + ".bak")
     print(f"Backup created: {file_path}.bak")
 
-    # Master Regex: Code blocks OR Display Math OR Inline Math
-    master_pattern = r'(?s)(`{1,3}.+?`{1,3})|(?<!\\)(\$\$)(.+?)(?<!\\)\$\$|(?<!\\)(\$)(?!\s)([^$\n`]+?)(?<!\s)(?<!\\)\$'
-    replacer = GlobalReplacer()
-    new_full_content = re.sub(master_pattern, replacer.process_match, full_content)
+    # Find every candidate first, then ask once per distinct word
+    replacer = GlobalReplacer(full_content)
+    for match in MASTER_RE.finditer(full_content):
+        replacer.collect(match)
+    accepted = replacer.review()
 
     if replacer.count > 0:
-        with open(file_path, 'w', encoding='utf-8') as f: f.write(new_full_content)
+        # Splice the wrapped words between untouched slices and hand them to
+        # writelines, instead of joining a second copy of the whole document.
+        # Each accepted word maps to one shared replacement string.
+        wrapped = {word: f"\\text{{{word}}}" for word in {cand[2] for cand in accepted}}
+        chunks = []
+        pos = 0
+        for start, end, word, *_ in accepted:
+            chunks.append(full_content[pos:start])
+            chunks.append(wrapped[word])
+            pos = end
+        chunks.append(full_content[pos:])
+        with open(file_path, 'w', encoding='utf-8') as f: f.writelines(chunks)
         print(f"\nSuccess! Wrapped {replacer.count} terms.")
     else:
         print("\nNo changes made.")
 
+def main():
+    # Several files can be given (e.g. every chapter of a book) so the
+    # interpreter start-up and regex compilation are paid once per batch
+    if len(sys.argv) < 2:
+        print("Usage: ./wrap_math_text.py <filename.qmd> [more.qmd ...]")
+        sys.exit(1)
+    file_paths = sys.argv[1:]
+    for file_path in file_paths:
+        if not os.path.exists(file_path):
+            print(f"Error: File '{file_path}' not found.")
+            sys.exit(1)
+    for file_path in file_paths:
+        if len(file_paths) > 1:
+            print(f"\n=== {file_path} ===")
+        process_file(file_path)
+
 if __name__ == "__main__":
     main()
\ No newline at end of file